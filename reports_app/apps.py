@@ -3,3 +3,23 @@ from django.apps import AppConfig
 
 class ReportsAppConfig(AppConfig):
     name = 'reports_app'
+
+    def ready(self):
+        from django.core.signals import request_finished, request_started
+        from django.db.models.signals import post_delete
+        from .models import AcademicYear
+
+        # AcademicYear.get_current() is memoized only while a request is running
+        request_started.connect(
+            AcademicYear.start_current_cache,
+            dispatch_uid='reports_app.start_current_academic_year',
+        )
+        request_finished.connect(
+            AcademicYear.end_current_cache,
+            dispatch_uid='reports_app.end_current_academic_year',
+        )
+        post_delete.connect(
+            AcademicYear.clear_current_cache,
+            sender=AcademicYear,
+            dispatch_uid='reports_app.delete_current_academic_year',
+        )
@@ -9,10 +9,22 @@ This module defines the database schema for persistent storage of:
 """
 
 import secrets
+import threading
 from django.db import models
 from datetime import date
 
 
+# Per-thread memo for AcademicYear.get_current(). Only used between the
+# request_started and request_finished signals, so management commands,
+# background threads and tests outside a request always hit the database.
+_current_year = threading.local()
+
+
+def format_display_name(first_name, last_name):
+    """Faculty name in 'Last, First' format (see FacultyMember.display_name)."""
+    return f"{last_name}, {first_name}"
+
+
 class AcademicYear(models.Model):
     """
     Academic year tracking (July-June cycle).
@@ -47,10 +59,21 @@ class AcademicYear(models.Model):
         if self.is_current:
             AcademicYear.objects.filter(is_current=True).update(is_current=False)
         super().save(*args, **kwargs)
+        AcademicYear.clear_current_cache()
 
     @classmethod
     def get_current(cls):
-        """Get or create the current academic year based on today's date."""
+        """
+        Get or create the current academic year based on today's date.
+
+        Memoized for the rest of the request, since most pages look it up in
+        both the view and the academic-year context processor.
+        """
+        in_request = getattr(_current_year, 'in_request', False)
+        cached = getattr(_current_year, 'value', None)
+        if in_request and cached is not None:
+            return cached
+
         today = date.today()
         if today.month >= 7:  # July-December
             start_year = today.year
@@ -73,8 +96,27 @@ class AcademicYear(models.Model):
             year.is_current = True
             year.save()
 
+        if in_request:
+            _current_year.value = year
         return year
 
+    @staticmethod
+    def start_current_cache(**kwargs):
+        """Begin memoizing the current year for this request (request_started)."""
+        _current_year.in_request = True
+        _current_year.value = None
+
+    @staticmethod
+    def end_current_cache(**kwargs):
+        """Stop memoizing and forget the current year (request_finished)."""
+        _current_year.in_request = False
+        _current_year.value = None
+
+    @staticmethod
+    def clear_current_cache(**kwargs):
+        """Forget the memoized current year (on save and post_delete)."""
+        _current_year.value = None
+
 
 class FacultyMember(models.Model):
     """
@@ -204,7 +246,7 @@ class FacultyMember(models.Model):
     @property
     def display_name(self):
         """Return name in 'Last, First' format."""
-        return f"{self.last_name}, {self.first_name}"
+        return format_display_name(self.first_name, self.last_name)
 
     def get_portal_url(self):
         """Get the permanent portal URL for this faculty member."""
@@ -0,0 +1,17 @@
+# Generated by Django 6.0 on 2026-10-16 04:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('survey_app', '0006_add_academic_year_to_config'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='surveyresponsehistory',
+            index=models.Index(fields=['response', '-created_at'], name='survey_hist_resp_created_idx'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 6.0 on 2026-10-16 05:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports_app', '0013_academicyear_review_mode_enabled'),
+        ('survey_app', '0007_add_history_response_created_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='surveyinvitation',
+            index=models.Index(fields=['campaign', 'email_sent_at'], name='survey_inv_camp_sent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='surveyinvitation',
+            index=models.Index(fields=['campaign', 'status'], name='survey_inv_camp_status_idx'),
+        ),
+    ]
@@ -8,9 +8,11 @@ This module defines:
 - EmailLog: Audit trail for sent emails
 """
 
+import json
 import secrets
-from django.db import models
+from django.db import connection, models
 from django.utils import timezone
+from django.utils.functional import cached_property
 
 from reports_app.models import AcademicYear, FacultyMember
 
@@ -111,14 +113,17 @@ class SurveyCampaign(models.Model):
     def __str__(self):
         return self.name
 
-    @property
+    @cached_property
     def is_open(self):
-        """Check if campaign is currently accepting submissions."""
-        now = timezone.now()
-        return (
-            self.is_active and
-            self.opens_at <= now <= self.closes_at
-        )
+        """
+        Check if campaign is currently accepting submissions.
+
+        Cached for the life of the instance (one request), since the survey
+        views and templates check it several times per page.
+        """
+        if not self.is_active:
+            return False
+        return self.opens_at <= timezone.now() <= self.closes_at
 
     @property
     def status(self):
@@ -135,19 +140,29 @@ class SurveyCampaign(models.Model):
     @property
     def submission_stats(self):
         """Return submission statistics."""
-        total = self.invitations.count()
-        submitted = self.invitations.filter(status='submitted').count()
-        in_progress = self.invitations.filter(status='in_progress').count()
-        pending = self.invitations.filter(status='pending').count()
-        not_emailed = self.invitations.filter(email_sent_at__isnull=True).count()
-        not_submitted = self.invitations.exclude(status='submitted').count()
+        return self.stats_for_invitations(self.invitations.only('status', 'email_sent_at'))
+
+    @staticmethod
+    def stats_for_invitations(invitations):
+        """Submission statistics for already-loaded invitations of one campaign."""
+        total = submitted = in_progress = pending = not_emailed = 0
+        for inv in invitations:
+            total += 1
+            if inv.status == 'submitted':
+                submitted += 1
+            elif inv.status == 'in_progress':
+                in_progress += 1
+            elif inv.status == 'pending':
+                pending += 1
+            if inv.email_sent_at is None:
+                not_emailed += 1
         return {
             'total': total,
             'submitted': submitted,
             'in_progress': in_progress,
             'pending': pending,
             'not_emailed': not_emailed,
-            'not_submitted': not_submitted,
+            'not_submitted': total - submitted,
             'completion_rate': (submitted / total * 100) if total > 0 else 0
         }
 
@@ -201,6 +216,11 @@ class SurveyInvitation(models.Model):
     class Meta:
         unique_together = ['campaign', 'faculty']
         ordering = ['faculty__last_name', 'faculty__first_name']
+        indexes = [
+            # Pending-invitation and reminder filters on the send views
+            models.Index(fields=['campaign', 'email_sent_at'], name='survey_inv_camp_sent_idx'),
+            models.Index(fields=['campaign', 'status'], name='survey_inv_camp_status_idx'),
+        ]
         verbose_name = 'Survey Invitation'
         verbose_name_plural = 'Survey Invitations'
 
@@ -210,10 +230,18 @@ class SurveyInvitation(models.Model):
     def mark_accessed(self):
         """Mark first access time if not already set."""
         if not self.first_accessed_at:
-            self.first_accessed_at = timezone.now()
+            self.first_accessed_at = self.updated_at = timezone.now()
             if self.status == 'pending':
                 self.status = 'in_progress'
-            self.save(update_fields=['first_accessed_at', 'status', 'updated_at'])
+            # Conditional UPDATE, so a concurrent first visit (another tab)
+            # can't overwrite the time already recorded
+            SurveyInvitation.objects.filter(
+                pk=self.pk, first_accessed_at__isnull=True
+            ).update(
+                first_accessed_at=self.first_accessed_at,
+                status=self.status,
+                updated_at=self.updated_at,
+            )
 
     def mark_submitted(self):
         """Mark invitation as submitted."""
@@ -222,6 +250,27 @@ class SurveyInvitation(models.Model):
         self.save(update_fields=['status', 'submitted_at', 'updated_at'])
 
 
+class _JSONSetKey(models.Func):
+    """
+    A JSON column with one top-level key replaced, computed by the database
+    (SQLite JSON_SET / PostgreSQL jsonb_set), for use in QuerySet.update().
+    """
+    output_field = models.JSONField()
+
+    def __init__(self, column, key, value):
+        super().__init__(models.F(column))
+        self.key = key
+        self.value = json.dumps(value)
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        column_sql, params = compiler.compile(self.get_source_expressions()[0])
+        return f'JSON_SET({column_sql}, %s, JSON(%s))', (*params, f'$."{self.key}"', self.value)
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        column_sql, params = compiler.compile(self.get_source_expressions()[0])
+        return f'JSONB_SET({column_sql}, %s::text[], %s::jsonb)', (*params, [self.key], self.value)
+
+
 class SurveyResponse(models.Model):
     """
     Survey response data (draft or submitted).
@@ -289,6 +338,23 @@ class SurveyResponse(models.Model):
         ])
         return int(completed / 5 * 100)
 
+    @cached_property
+    def category_summary(self):
+        """Key, name, completion and points of each category, in survey order."""
+        # Imported here: survey_config reads ActivityType point values at
+        # import time, which must not happen while models are still loading.
+        from .survey_config import CATEGORY_TABLE
+
+        return [
+            {
+                'key': cat.key,
+                'name': cat.name,
+                'complete': getattr(self, f'{cat.key}_complete', False),
+                'points': getattr(self, f'{cat.key}_points', 0),
+            }
+            for cat in CATEGORY_TABLE
+        ]
+
     def get_category_data(self, category):
         """Get response data for a specific category."""
         return self.response_data.get(category, {})
@@ -298,6 +364,31 @@ class SurveyResponse(models.Model):
         self.response_data[category] = data
         self.save()
 
+    def save_category_draft(self, category, data, points):
+        """
+        Store one category's draft data and points.
+
+        On SQLite and PostgreSQL only that key of response_data is rewritten,
+        inside the database, so the rest of the blob doesn't need to be loaded
+        (it may be deferred) or sent back. Other backends do a normal save.
+        """
+        points_field = f'{category}_points'
+        setattr(self, points_field, points)
+
+        if connection.vendor not in ('sqlite', 'postgresql'):
+            self.response_data[category] = data
+            self.save(update_fields=['response_data', points_field, 'updated_at'])
+            return
+
+        self.updated_at = timezone.now()
+        SurveyResponse.objects.filter(pk=self.pk).update(
+            response_data=_JSONSetKey('response_data', category, data),
+            updated_at=self.updated_at,
+            **{points_field: points},
+        )
+        if 'response_data' not in self.get_deferred_fields():
+            self.response_data[category] = data
+
 
 class EmailLog(models.Model):
     """
@@ -388,6 +479,9 @@ class SurveyResponseHistory(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['response', '-created_at'], name='survey_hist_resp_created_idx'),
+        ]
         verbose_name = 'Response History'
         verbose_name_plural = 'Response History'
 
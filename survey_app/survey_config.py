@@ -16,6 +16,10 @@ The POINT_VALUES dict below serves as fallback defaults if database
 lookup fails. Edit values via the Activity Points Config page, not here.
 """
 
+import math
+import re
+from typing import NamedTuple, Optional
+
 from .points_mapping import get_all_point_values, DEFAULT_POINT_VALUES
 
 # Get point values from database, with fallback to defaults
@@ -1110,11 +1114,88 @@ def get_active_survey_config():
 
 def get_category_config(category_key, academic_year=None):
     """Get configuration for a specific category."""
+    if academic_year is None:
+        # Default config needs no override lookup
+        return SURVEY_CATEGORIES.get(category_key)
     config = get_survey_config_for_year(academic_year)
     categories = config.get('categories', SURVEY_CATEGORIES)
     return categories.get(category_key)
 
 
+_INT_RE = re.compile(r'\s*[+-]?\d+\s*')
+_FLOAT_RE = re.compile(r'\s*[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?\s*')
+
+
+def _as_int(value):
+    """Return value as an int, or None if it isn't an integer."""
+    if isinstance(value, (int, float)):
+        return int(value) if math.isfinite(value) else None
+    if isinstance(value, str) and _INT_RE.fullmatch(value):
+        return int(value)
+    return None
+
+
+def _as_float(value):
+    """Return value as a finite float, or None if it isn't numeric."""
+    if isinstance(value, (int, float)):
+        value = float(value)
+    elif isinstance(value, str) and _FLOAT_RE.fullmatch(value):
+        value = float(value)
+    else:
+        return None
+    return value if math.isfinite(value) else None
+
+
+def parse_number(value):
+    """
+    Convert a submitted number field to an int or float for storage.
+
+    Returns None if the value isn't numeric, so callers can keep the raw text.
+    """
+    number = _as_float(value)
+    if number is None:
+        return None
+    return int(number) if number.is_integer() else number
+
+
+def _compile_points_fields(subsection_config):
+    """
+    Flatten a subsection's point-bearing radio fields for scoring.
+
+    Returns a list of (field name, {choice value: points}, fallback points),
+    where fallback is the minimum non-zero choice (or None) used for imported
+    entries with no type selected.
+
+    Raises ValueError if the subsection has no trigger field, since scoring
+    relies on the trigger to ignore entries left behind after answering "no".
+    """
+    if not subsection_config.get('trigger', {}).get('field'):
+        raise ValueError(
+            f"Repeating subsection '{subsection_config.get('key')}' has no trigger field"
+        )
+
+    points_fields = []
+    for field in subsection_config.get('fields', []):
+        if field['type'] == 'radio' and 'choices' in field:
+            choice_points = {}
+            for choice_val, choice_label, points in field['choices']:
+                choice_points.setdefault(choice_val, points)
+            non_zero_points = [pts for _, _, pts in field['choices'] if pts > 0]
+            fallback_points = min(non_zero_points) if non_zero_points else None
+            points_fields.append((field['name'], choice_points, fallback_points))
+    return points_fields
+
+
+# Precompiled point lookups for the default config, keyed by subsection dict id
+# (these dicts live for the life of the process). Override configs compile per call.
+_POINTS_FIELDS = {
+    id(subsection): _compile_points_fields(subsection)
+    for category in SURVEY_CATEGORIES.values()
+    for subsection in category['subsections']
+    if subsection['type'] == 'repeating'
+}
+
+
 def calculate_subsection_points(subsection_config, subsection_data):
     """
     Calculate points for a subsection based on config and submitted data.
@@ -1135,54 +1216,51 @@ def calculate_subsection_points(subsection_config, subsection_data):
             total = subsection_config.get('points_if_yes', 0)
         return total
 
+    # Trigger answered "no" - any entries left in the (hidden) form don't count
+    if subsection_data.get('trigger') == 'no':
+        return 0
+
     # Repeating type - sum points from entries
     entries = subsection_data.get('entries', [])
 
-    # Filter out carried-forward entries - they were already counted in their source quarter
-    new_entries = [e for e in entries if not e.get('_carried_from')]
+    points_fields = _POINTS_FIELDS.get(id(subsection_config))
+    if points_fields is None:
+        points_fields = _compile_points_fields(subsection_config)
 
     # Check if this subsection uses flat points per entry (e.g., thesis committees)
+    # Carried-forward entries are skipped - they were already counted in their source quarter
     points_per_entry = subsection_config.get('points_per_entry', 0)
     if points_per_entry:
-        return len(new_entries) * points_per_entry
+        return sum(1 for e in entries if not e.get('_carried_from')) * points_per_entry
 
-    for entry in new_entries:
+    for entry in entries:
+        if entry.get('_carried_from'):
+            continue
         entry_points = 0
 
         # Find the field with points (usually 'type' or 'role')
-        for field in subsection_config['fields']:
-            if field['type'] == 'radio' and 'choices' in field:
-                selected_value = entry.get(field['name'])
-                if selected_value and selected_value != '99':
-                    # Find points for this choice
-                    for choice_val, choice_label, points in field['choices']:
-                        if choice_val == selected_value:
-                            entry_points = points
-                            break
-                elif not selected_value and entry:
-                    # Fallback: entry exists but no type selected (imported data)
-                    # Give minimum non-zero points from choices
-                    non_zero_points = [pts for _, _, pts in field['choices'] if pts > 0]
-                    if non_zero_points:
-                        entry_points = min(non_zero_points)
+        for field_name, choice_points, fallback_points in points_fields:
+            selected_value = entry.get(field_name)
+            if selected_value and selected_value != '99':
+                if isinstance(selected_value, str) and selected_value in choice_points:
+                    entry_points = choice_points[selected_value]
+            elif not selected_value and entry and fallback_points is not None:
+                # Fallback: entry exists but no type selected (imported data)
+                entry_points = fallback_points
 
         # Special handling for peer-reviewed publications (multiply by impact factor)
         if subsection_config['key'] == 'publications_peer':
-            try:
-                impact_factor = min(float(entry.get('impact_factor', 0)), 15)  # Max 15
-                entry_points = int(entry_points * impact_factor)
-            except (ValueError, TypeError):
-                pass
+            impact_factor = _as_float(entry.get('impact_factor', 0))
+            if impact_factor is not None:
+                entry_points = int(entry_points * min(impact_factor, 15))  # Max 15
 
         # Special handling for MyTIP (multiply by count)
         if entry.get('type') == 'mytip_each' and entry.get('count'):
-            try:
-                count = int(entry.get('count', 1))
+            count = _as_int(entry.get('count', 1))
+            if count is not None:
                 entry_points = entry_points * count
                 # Cap at 3000 per year (120 mentions at 25 pts each)
                 entry_points = min(entry_points, 3000)
-            except (ValueError, TypeError):
-                pass
 
         total += entry_points
 
@@ -1213,26 +1291,44 @@ def calculate_category_points(category_key, response_data):
     return total
 
 
+class CategoryInfo(NamedTuple):
+    """Display and navigation details for one survey category."""
+    key: str
+    name: str
+    prev_key: Optional[str]
+    next_key: Optional[str]
+
+
+# One entry per category in navigation order, so tabs and prev/next links
+# come from a single lookup instead of CATEGORY_ORDER + CATEGORY_NAMES + config
+CATEGORY_TABLE = tuple(
+    CategoryInfo(
+        key=cat,
+        name=CATEGORY_NAMES[cat],
+        prev_key=CATEGORY_ORDER[i - 1] if i > 0 else None,
+        next_key=CATEGORY_ORDER[i + 1] if i < len(CATEGORY_ORDER) - 1 else None,
+    )
+    for i, cat in enumerate(CATEGORY_ORDER)
+)
+_CATEGORY_INDEX = {info.key: i for i, info in enumerate(CATEGORY_TABLE)}
+
+
+def get_category_info(category_key):
+    """Get the CategoryInfo for a category key, or None if unknown."""
+    index = _CATEGORY_INDEX.get(category_key)
+    return CATEGORY_TABLE[index] if index is not None else None
+
+
 def get_next_category(current_category):
     """Get the next category in sequence."""
-    try:
-        idx = CATEGORY_ORDER.index(current_category)
-        if idx < len(CATEGORY_ORDER) - 1:
-            return CATEGORY_ORDER[idx + 1]
-    except ValueError:
-        pass
-    return None
+    info = get_category_info(current_category)
+    return info.next_key if info else None
 
 
 def get_prev_category(current_category):
     """Get the previous category in sequence."""
-    try:
-        idx = CATEGORY_ORDER.index(current_category)
-        if idx > 0:
-            return CATEGORY_ORDER[idx - 1]
-    except ValueError:
-        pass
-    return None
+    info = get_category_info(current_category)
+    return info.prev_key if info else None
 
 
 def get_carry_forward_subsections():
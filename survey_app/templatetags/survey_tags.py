@@ -2,8 +2,18 @@
 Custom template tags and filters for the survey app.
 """
 from django import template
+from django.utils.safestring import mark_safe
 import json
 
+try:
+    import orjson
+
+    def _dumps(value):
+        return orjson.dumps(value).decode()
+except ImportError:
+    def _dumps(value):
+        return json.dumps(value)
+
 register = template.Library()
 
 
@@ -37,16 +47,17 @@ def get_index(lst, index):
     return None
 
 
-@register.filter
+@register.filter(is_safe=True)
 def to_json(value):
     """
     Convert a Python object to JSON string.
+    Uses orjson when installed, otherwise the stdlib json module.
     Usage: {{ mydict|to_json }}
     """
     try:
-        return json.dumps(value)
+        return mark_safe(_dumps(value))
     except (TypeError, ValueError):
-        return '{}'
+        return mark_safe('{}')
 
 
 @register.filter
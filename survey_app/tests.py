@@ -1,3 +1,63 @@
+import json
+from datetime import date, timedelta
+
 from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from reports_app.models import AcademicYear, FacultyMember
+from .models import SurveyCampaign, SurveyInvitation, SurveyResponse
+
+
+class SurveySaveDraftTests(TestCase):
+    """The AJAX draft endpoint only stores data parsed from the category config."""
+
+    def setUp(self):
+        year = AcademicYear.objects.create(
+            year_code='24-25',
+            start_date=date(2024, 7, 1),
+            end_date=date(2025, 6, 30),
+        )
+        faculty = FacultyMember.objects.create(
+            email='doe@example.com', first_name='Jane', last_name='Doe',
+        )
+        now = timezone.now()
+        campaign = SurveyCampaign.objects.create(
+            academic_year=year,
+            quarter='Q1',
+            name='AY 24-25 Q1 Survey',
+            opens_at=now - timedelta(days=1),
+            closes_at=now + timedelta(days=1),
+        )
+        self.invitation = SurveyInvitation.objects.create(campaign=campaign, faculty=faculty)
+        self.url = reverse('survey:survey_save_draft', args=[self.invitation.token])
+
+    def post(self, payload):
+        return self.client.post(self.url, json.dumps(payload), content_type='application/json')
+
+    def test_malformed_draft_data_is_rejected(self):
+        for data in (['bad'], {'committees_trigger': ['yes']}, 'bad'):
+            with self.subTest(data=data):
+                response = self.post({'category': 'citizenship', 'data': data})
+                self.assertEqual(response.status_code, 400)
+
+        self.assertEqual(self.post(['citizenship']).status_code, 400)
+        self.assertEqual(self.post({'category': ['citizenship']}).status_code, 400)
+        self.assertEqual(self.post({'category': 'bogus', 'data': {}}).status_code, 400)
+
+    def test_draft_is_parsed_like_the_category_form(self):
+        response = self.post({'category': 'citizenship', 'data': {
+            'committees_trigger': 'yes',
+            'committees_0_type': 'unmc',
+            'committees_0_name': 'IRB',
+            'not_a_subsection': 'junk',
+        }})
+        self.assertEqual(response.status_code, 200)
 
-# Create your tests here.
+        stored = SurveyResponse.objects.get(invitation=self.invitation).response_data['citizenship']
+        self.assertNotIn('not_a_subsection', stored)
+        self.assertEqual(stored['committees'], {
+            'trigger': 'yes',
+            'entries': [{'type': 'unmc', 'name': 'IRB'}],
+        })
+        self.assertGreater(response.json()['points'], 0)
@@ -3,20 +3,26 @@ Views for the Survey feature.
 
 Admin views for campaign management and faculty views for survey completion.
 """
+import functools
+import hashlib
+import json
+import re
+
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
-from django.http import JsonResponse, Http404, HttpResponse
+from django.http import JsonResponse, Http404, HttpResponse, StreamingHttpResponse
 from django.utils import timezone
 from django.db import transaction
-from django.views.decorators.http import require_POST, require_GET
+from django.db.models import Count, F, Q
+from django.views.decorators.http import require_POST, require_GET, condition
 
 
-from reports_app.models import AcademicYear, FacultyMember
+from reports_app.models import AcademicYear, FacultyMember, format_display_name
 from .models import SurveyCampaign, SurveyInvitation, SurveyResponse, EmailLog, SurveyConfigOverride
 from .survey_config import (
     get_category_config, calculate_category_points,
-    get_next_category, get_prev_category, CATEGORY_ORDER, CATEGORY_NAMES,
-    get_carry_forward_subsections, extract_carry_forward_data
+    get_next_category, get_prev_category, CATEGORY_ORDER, CATEGORY_NAMES, CATEGORY_TABLE,
+    get_carry_forward_subsections, extract_carry_forward_data, parse_number
 )
 
 
@@ -27,7 +33,12 @@ from .survey_config import (
 
 def campaign_list(request):
     """List all survey campaigns with status and statistics."""
-    campaigns = SurveyCampaign.objects.select_related('academic_year').all()
+    # Counts come back with the campaigns in one query instead of
+    # per-row submission_stats lookups
+    campaigns = SurveyCampaign.objects.select_related('academic_year').annotate(
+        invitation_count=Count('invitations'),
+        submitted_count=Count('invitations', filter=Q(invitations__status='submitted')),
+    )
 
     # Get current academic year for "create new" default
     current_year = AcademicYear.get_current()
@@ -80,21 +91,27 @@ def campaign_create(request):
             if not name:
                 name = f"AY {year_code} {quarter} Survey"
 
-            campaign = SurveyCampaign.objects.create(
-                academic_year=academic_year,
-                quarter=quarter,
-                name=name,
-                opens_at=opens_at,
-                closes_at=closes_at,
-            )
+            # Campaign and its invitations commit together, so a failed
+            # insert can't leave a campaign with a partial faculty list
+            with transaction.atomic():
+                campaign = SurveyCampaign.objects.create(
+                    academic_year=academic_year,
+                    quarter=quarter,
+                    name=name,
+                    opens_at=opens_at,
+                    closes_at=closes_at,
+                )
 
-            # Create invitations for all active faculty
-            active_faculty = FacultyMember.objects.filter(is_active=True)
-            invitations = [
-                SurveyInvitation(campaign=campaign, faculty=faculty)
-                for faculty in active_faculty
-            ]
-            SurveyInvitation.objects.bulk_create(invitations)
+                # Create invitations for all active faculty
+                # (only the keys are needed, so skip loading FacultyMember rows)
+                active_faculty_ids = FacultyMember.objects.filter(
+                    is_active=True
+                ).values_list('pk', flat=True)
+                invitations = [
+                    SurveyInvitation(campaign=campaign, faculty_id=faculty_id)
+                    for faculty_id in active_faculty_ids.iterator(chunk_size=500)
+                ]
+                SurveyInvitation.objects.bulk_create(invitations, batch_size=500)
 
             messages.success(
                 request,
@@ -122,17 +139,20 @@ def campaign_detail(request, pk):
         pk=pk
     )
 
-    # Get invitations with faculty info
-    invitations = campaign.invitations.select_related('faculty').all()
+    # Get invitations with faculty info (one query; everything below reuses it)
+    invitations = list(campaign.invitations.select_related('faculty').all())
 
     # Group by status
-    pending = invitations.filter(status='pending')
-    in_progress = invitations.filter(status='in_progress')
-    submitted = invitations.filter(status='submitted')
+    pending = [inv for inv in invitations if inv.status == 'pending']
+    in_progress = [inv for inv in invitations if inv.status == 'in_progress']
+    submitted = [inv for inv in invitations if inv.status == 'submitted']
+
+    # Same figures as campaign.submission_stats, from the rows already loaded
+    stats = SurveyCampaign.stats_for_invitations(invitations)
 
     # Get all active faculty for management section
     all_faculty = FacultyMember.objects.filter(is_active=True).order_by('last_name', 'first_name')
-    invited_emails = set(invitations.values_list('faculty__email', flat=True))
+    invited_emails = {inv.faculty_id for inv in invitations}
 
     context = {
         'campaign': campaign,
@@ -140,7 +160,7 @@ def campaign_detail(request, pk):
         'pending': pending,
         'in_progress': in_progress,
         'submitted': submitted,
-        'stats': campaign.submission_stats,
+        'stats': stats,
         'all_faculty': all_faculty,
         'invited_emails': invited_emails,
     }
@@ -188,10 +208,10 @@ def campaign_update_faculty(request, pk):
     # Get selected faculty emails from form
     selected_emails = set(request.POST.getlist('faculty'))
 
-    # Get current invitations
+    # Get current invitations, keyed by faculty email (the FacultyMember primary key)
     current_invitations = {
-        inv.faculty.email: inv
-        for inv in campaign.invitations.select_related('faculty')
+        inv.faculty_id: inv
+        for inv in campaign.invitations.select_related('response').defer('response__response_data')
     }
     current_emails = set(current_invitations.keys())
 
@@ -199,18 +219,11 @@ def campaign_update_faculty(request, pk):
     to_add = selected_emails - current_emails
     to_remove = current_emails - selected_emails
 
-    added_count = 0
     removed_count = 0
     skipped_count = 0
 
-    # Add new invitations
-    for email in to_add:
-        faculty = FacultyMember.objects.filter(email=email).first()
-        if faculty:
-            SurveyInvitation.objects.create(campaign=campaign, faculty=faculty)
-            added_count += 1
-
     # Remove invitations (only if not submitted or in progress with data)
+    remove_ids = []
     for email in to_remove:
         inv = current_invitations.get(email)
         if inv:
@@ -222,9 +235,23 @@ def campaign_update_faculty(request, pk):
             if inv.status == 'in_progress' and hasattr(inv, 'response'):
                 skipped_count += 1
                 continue
-            inv.delete()
+            remove_ids.append(inv.pk)
             removed_count += 1
 
+    with transaction.atomic():
+        # Add new invitations for the selected emails that match a faculty member
+        new_invitations = [
+            SurveyInvitation(campaign=campaign, faculty_id=faculty_id)
+            for faculty_id in FacultyMember.objects.filter(
+                pk__in=to_add
+            ).values_list('pk', flat=True)
+        ]
+        SurveyInvitation.objects.bulk_create(new_invitations, batch_size=500)
+        added_count = len(new_invitations)
+
+        if remove_ids:
+            SurveyInvitation.objects.filter(pk__in=remove_ids).delete()
+
     # Build feedback message
     msg_parts = []
     if added_count:
@@ -259,16 +286,22 @@ def campaign_sync_from_import(request, pk):
     skipped_count = 0
 
     # Get all invitations that don't have a SurveyResponse yet
-    for invitation in campaign.invitations.select_related('faculty'):
-        # Check if already has response
-        if SurveyResponse.objects.filter(invitation=invitation).exists():
-            continue
+    invitations = list(
+        campaign.invitations.select_related('faculty').filter(response__isnull=True)
+    )
 
+    # Load matching FacultySurveyData for all of them in one query
+    survey_data_by_faculty = {
+        fsd.faculty_id: fsd
+        for fsd in FacultySurveyData.objects.filter(
+            faculty__in=[inv.faculty_id for inv in invitations],
+            academic_year=campaign.academic_year,
+        )
+    }
+
+    for invitation in invitations:
         # Find matching FacultySurveyData
-        fsd = FacultySurveyData.objects.filter(
-            faculty=invitation.faculty,
-            academic_year=campaign.academic_year
-        ).first()
+        fsd = survey_data_by_faculty.get(invitation.faculty_id)
 
         if fsd and fsd.activities_json:
             # Convert and create SurveyResponse
@@ -340,21 +373,24 @@ def campaign_send_email(request, pk):
             messages.warning(request, 'No recipients selected.')
             return redirect('survey:campaign_send_email', pk=pk)
 
-        sent_count = 0
-        failed_count = 0
-
-        for email in selected_emails:
-            inv = campaign.invitations.filter(faculty__email=email).first()
-            if inv:
-                if email_type == 'invitation':
-                    success = _send_invitation_email(inv)
-                else:  # reminder
-                    success = _send_reminder_email(inv)
+        # Fetch all selected invitations in one query, keyed by faculty email
+        # (the FacultyMember primary key)
+        selected_invitations = {
+            inv.faculty_id: inv
+            for inv in campaign.invitations.select_related('faculty', 'campaign').filter(
+                faculty__email__in=selected_emails
+            )
+        }
 
-                if success:
-                    sent_count += 1
-                else:
-                    failed_count += 1
+        to_send = [
+            selected_invitations[email] for email in selected_emails
+            if email in selected_invitations
+        ]
+        if email_type == 'invitation':
+            sent_count, failed_count = _send_bulk_invitations(to_send)
+        else:  # reminder
+            sent, failed_count = _send_bulk_emails(to_send, _send_reminder_email)
+            sent_count = len(sent)
 
         if sent_count > 0:
             messages.success(request, f'Successfully sent {sent_count} {email_type} email(s).')
@@ -395,7 +431,9 @@ def campaign_send_invitations(request, pk):
 
         if single_faculty_email:
             # Send to single faculty (resend)
-            invitation = campaign.invitations.filter(faculty__email=single_faculty_email).first()
+            invitation = campaign.invitations.select_related('faculty', 'campaign').filter(
+                faculty__email=single_faculty_email
+            ).first()
             if invitation:
                 success = _send_invitation_email(invitation)
                 if success:
@@ -410,21 +448,12 @@ def campaign_send_invitations(request, pk):
                 return redirect(redirect_url)
         else:
             # Send to all pending
-            pending = campaign.invitations.filter(email_sent_at__isnull=True)
-            pending_count = pending.count()
+            pending = _claim_pending_invitations(campaign)
 
-            if pending_count == 0:
+            if not pending:
                 messages.info(request, 'No pending invitations to send. All faculty have already been emailed.')
             else:
-                sent_count = 0
-                failed_count = 0
-
-                for invitation in pending:
-                    success = _send_invitation_email(invitation)
-                    if success:
-                        sent_count += 1
-                    else:
-                        failed_count += 1
+                sent_count, failed_count = _send_claimed_invitations(pending)
 
                 if sent_count > 0:
                     messages.success(request, f'Sent {sent_count} invitation emails')
@@ -441,17 +470,12 @@ def campaign_send_reminders(request, pk):
 
     if request.method == 'POST':
         # Get invitations that are not submitted
-        not_submitted = campaign.invitations.exclude(status='submitted')
-
-        sent_count = 0
-        failed_count = 0
+        not_submitted = campaign.invitations.exclude(
+            status='submitted'
+        ).select_related('faculty', 'campaign')
 
-        for invitation in not_submitted:
-            success = _send_reminder_email(invitation)
-            if success:
-                sent_count += 1
-            else:
-                failed_count += 1
+        sent, failed_count = _send_bulk_emails(not_submitted, _send_reminder_email)
+        sent_count = len(sent)
 
         if sent_count > 0:
             messages.success(request, f'Sent {sent_count} reminder emails')
@@ -470,18 +494,19 @@ def invitation_unlock(request, pk):
     if invitation.status != 'submitted':
         messages.warning(request, 'This survey is not submitted, no need to unlock')
     else:
-        invitation.status = 'in_progress'
-        invitation.submitted_at = None
-        invitation.save()
-
-        # Log the unlock for audit trail
-        if hasattr(invitation, 'response'):
-            from .models import SurveyResponseHistory
-            SurveyResponseHistory.log_change(
-                response=invitation.response,
-                action='unlock',
-                request=request
-            )
+        # Unlock and log it for audit trail in one commit
+        from .models import SurveyResponseHistory
+        with transaction.atomic():
+            invitation.status = 'in_progress'
+            invitation.submitted_at = None
+            invitation.save()
+
+            if hasattr(invitation, 'response'):
+                SurveyResponseHistory.log_change(
+                    response=invitation.response,
+                    action='unlock',
+                    request=request
+                )
 
         messages.success(
             request,
@@ -504,7 +529,13 @@ def invitation_history(request, pk):
 
     history = []
     if hasattr(invitation, 'response'):
-        history = invitation.response.history.all()[:50]  # Last 50 entries
+        # Last 50 entries; skip the full response_data snapshots, which the
+        # page doesn't show
+        history = list(
+            SurveyResponseHistory.objects.filter(response=invitation.response)
+            .only('response', 'action', 'category', 'points_snapshot', 'ip_address', 'created_at')
+            .order_by('-created_at')[:50]
+        )
 
     context = {
         'invitation': invitation,
@@ -514,21 +545,19 @@ def invitation_history(request, pk):
 
 
 
-def campaign_export_csv(request, pk):
-    """Export campaign survey responses to CSV with labels."""
-    import csv
-    from django.http import HttpResponse
-    from .survey_config import CATEGORY_NAMES, get_category_config
+class _Echo:
+    """Pseudo-buffer for csv.writer that returns each row instead of storing it."""
 
-    campaign = get_object_or_404(SurveyCampaign, pk=pk)
+    def write(self, value):
+        return value
 
-    # Create the HttpResponse object with CSV header
-    response = HttpResponse(content_type='text/csv')
-    response['Content-Disposition'] = f'attachment; filename="survey_export_{campaign.pk}_{timezone.now().strftime("%Y%m%d_%H%M")}.csv"'
 
-    writer = csv.writer(response)
+def _build_export_layout():
+    """
+    Return (headers, schema) for the campaign CSV export.
 
-    # Build header row
+    schema is a list of (category key, [subsection keys]) in column order.
+    """
     headers = [
         'Faculty Name',
         'Email',
@@ -541,74 +570,105 @@ def campaign_export_csv(request, pk):
         'Content Expert Points',
         'Total Points',
     ]
-
-    # Add headers for each category's data
-    for cat_key in ['citizenship', 'education', 'research', 'leadership', 'content_expert']:
+    schema = []
+    for cat_key in CATEGORY_ORDER:
         config = get_category_config(cat_key)
         if config:
+            schema.append((
+                cat_key,
+                [sub['key'] for sub in config.get('subsections', [])],
+            ))
             for sub in config.get('subsections', []):
                 headers.append(f"{config['name']}: {sub['name']} (Trigger)")
                 headers.append(f"{config['name']}: {sub['name']} (Data)")
+    return headers, schema
 
-    writer.writerow(headers)
 
-    # Get all invitations with responses
-    invitations = campaign.invitations.select_related(
-        'faculty', 'response'
-    ).all().order_by('faculty__last_name', 'faculty__first_name')
+# The export uses the default category config, which is fixed for the life of
+# the process, so the column layout is built once at import
+_EXPORT_HEADERS, _EXPORT_SCHEMA = _build_export_layout()
 
-    for inv in invitations:
+
+def campaign_export_csv(request, pk):
+    """Export campaign survey responses to CSV with labels."""
+    import csv
+
+    campaign = get_object_or_404(SurveyCampaign, pk=pk)
+
+    headers, export_schema = _EXPORT_HEADERS, _EXPORT_SCHEMA
+    empty_data_columns = [''] * (2 * sum(len(sub_keys) for _, sub_keys in export_schema))
+
+    # Get all invitations with responses as plain tuples - the export only
+    # reads column values, so skip building invitation/faculty/response objects
+    invitations = campaign.invitations.order_by(
+        'faculty__last_name', 'faculty__first_name'
+    ).values_list(
+        'faculty__last_name', 'faculty__first_name', 'faculty__email',
+        'status', 'submitted_at', 'response__pk',
+        'response__citizenship_points', 'response__education_points',
+        'response__research_points', 'response__leadership_points',
+        'response__content_expert_points', 'response__response_data',
+    )
+    status_labels = dict(SurveyInvitation.STATUS_CHOICES)
+
+    def build_row(values):
+        (last_name, first_name, email, status, submitted_at, response_pk,
+         *category_points, response_data) = values
         row = [
-            inv.faculty.display_name,
-            inv.faculty.email,
-            inv.get_status_display(),
-            inv.submitted_at.strftime('%Y-%m-%d %H:%M') if inv.submitted_at else '',
+            format_display_name(first_name, last_name),
+            email,
+            status_labels.get(status, status),
+            submitted_at.strftime('%Y-%m-%d %H:%M') if submitted_at else '',
         ]
 
         # Get response data
-        resp = getattr(inv, 'response', None)
-        if resp:
-            row.extend([
-                resp.citizenship_points,
-                resp.education_points,
-                resp.research_points,
-                resp.leadership_points,
-                resp.content_expert_points,
-                resp.total_points,
-            ])
+        if response_pk is not None:
+            row.extend(category_points)
+            row.append(sum(category_points))
 
             # Add category data
-            response_data = resp.response_data or {}
-            for cat_key in ['citizenship', 'education', 'research', 'leadership', 'content_expert']:
-                config = get_category_config(cat_key)
-                if config:
-                    cat_data = response_data.get(cat_key, {})
-                    for sub in config.get('subsections', []):
-                        sub_data = cat_data.get(sub['key'], {})
-                        trigger = sub_data.get('trigger', '')
-                        entries = sub_data.get('entries', [])
-                        # Format entries as readable string
-                        if entries:
-                            entry_strs = []
-                            for e in entries:
-                                parts = [f"{k}: {v}" for k, v in e.items() if v]
-                                entry_strs.append('; '.join(parts))
-                            row.append(trigger)
-                            row.append(' | '.join(entry_strs))
-                        else:
-                            row.append(trigger)
-                            row.append('')
+            response_data = response_data or {}
+            for cat_key, sub_keys in export_schema:
+                cat_data = response_data.get(cat_key, {})
+                for sub_key in sub_keys:
+                    sub_data = cat_data.get(sub_key, {})
+                    trigger = sub_data.get('trigger', '')
+                    entries = sub_data.get('entries', [])
+                    # Format entries as readable string
+                    if entries:
+                        entry_strs = []
+                        for e in entries:
+                            parts = [f"{k}: {v}" for k, v in e.items() if v]
+                            entry_strs.append('; '.join(parts))
+                        row.append(trigger)
+                        row.append(' | '.join(entry_strs))
+                    else:
+                        row.append(trigger)
+                        row.append('')
         else:
             # No response - fill with empty values
             row.extend(['', '', '', '', '', ''])  # Points columns
-            for cat_key in ['citizenship', 'education', 'research', 'leadership', 'content_expert']:
-                config = get_category_config(cat_key)
-                if config:
-                    for sub in config.get('subsections', []):
-                        row.extend(['', ''])  # Trigger and Data columns
-
-        writer.writerow(row)
-
+            row.extend(empty_data_columns)  # Trigger and Data columns
+
+        return row
+
+    writer = csv.writer(_Echo())
+
+    def generate_csv():
+        yield writer.writerow(headers)
+        # Stream invitations in chunks so memory stays flat for large campaigns,
+        # flushing one joined string per chunk rather than one per row
+        batch = []
+        for values in invitations.iterator(chunk_size=500):
+            batch.append(writer.writerow(build_row(values)))
+            if len(batch) >= 500:
+                yield ''.join(batch)
+                batch.clear()
+        if batch:
+            yield ''.join(batch)
+
+    response = StreamingHttpResponse(generate_csv(), content_type='text/csv')
+    response['Content-Disposition'] = f'attachment; filename="survey_export_{campaign.pk}_{timezone.now().strftime("%Y%m%d_%H%M")}.csv"'
     return response
 
 
@@ -795,19 +855,20 @@ def _get_carry_forward_data_for_faculty(faculty, academic_year, exclude_campaign
 
     merged_data = {}
 
+    carry_forward_subsections = get_carry_forward_subsections()
+
     # First, check FacultySurveyData for imported data (from CSV/REDCap)
-    survey_data = FacultySurveyData.objects.filter(
+    activities_json = FacultySurveyData.objects.filter(
         faculty=faculty,
         academic_year=academic_year
-    ).first()
+    ).values_list('activities_json', flat=True).first()
 
-    if survey_data and survey_data.activities_json:
-        activities = survey_data.activities_json if isinstance(survey_data.activities_json, dict) else {}
+    if activities_json:
+        activities = activities_json if isinstance(activities_json, dict) else {}
 
         # Convert imported data format to survey form format
         # Imported: {category: {subcat: [entries]}}
         # Survey form expects: {category: {subcat: {trigger: "yes", entries: [...]}}}
-        carry_forward_subsections = get_carry_forward_subsections()
 
         # Field name mapping: imported field name -> survey form field name
         field_name_map = {
@@ -884,19 +945,33 @@ def _get_carry_forward_data_for_faculty(faculty, academic_year, exclude_campaign
                         'entries': [entry_copy]
                     }
 
-    # Then overlay with any previous SurveyResponse submissions (newer data wins)
+    # Then overlay with any previous SurveyResponse submissions (newer data wins).
+    # Only the carry-forward subsections are read, as JSON key lookups, so the
+    # rest of each response_data blob isn't transferred
+    carry_forward_paths = [
+        (cat_key, sub_key)
+        for cat_key, sub_keys in carry_forward_subsections.items()
+        for sub_key in sub_keys
+    ]
     previous_responses = SurveyResponse.objects.filter(
         invitation__faculty=faculty,
         invitation__campaign__academic_year=academic_year,
         invitation__status='submitted'
     ).exclude(
         invitation__campaign=exclude_campaign
-    ).select_related('invitation__campaign').order_by(
+    ).order_by(
         'invitation__campaign__quarter'  # Earlier quarters first
+    ).values_list(
+        'invitation__campaign__quarter',
+        *[f'response_data__{cat_key}__{sub_key}' for cat_key, sub_key in carry_forward_paths]
     )
 
-    for resp in previous_responses:
-        carry_forward = extract_carry_forward_data(resp.response_data or {})
+    for quarter, *sub_values in previous_responses:
+        response_data = {}
+        for (cat_key, sub_key), sub_data in zip(carry_forward_paths, sub_values):
+            if isinstance(sub_data, dict):
+                response_data.setdefault(cat_key, {})[sub_key] = sub_data
+        carry_forward = extract_carry_forward_data(response_data)
 
         # Merge into result (later quarters override earlier)
         for cat_key, cat_data in carry_forward.items():
@@ -906,7 +981,7 @@ def _get_carry_forward_data_for_faculty(faculty, academic_year, exclude_campaign
                 # Mark entries as carried forward
                 if 'entries' in sub_data:
                     for entry in sub_data['entries']:
-                        entry['_carried_from'] = resp.invitation.campaign.quarter
+                        entry['_carried_from'] = quarter
                 merged_data[cat_key][sub_key] = sub_data
 
     return merged_data
@@ -931,32 +1006,35 @@ def faculty_portal(request, token):
     # Find ALL currently open campaigns (filter by dates since is_open is a property)
     from django.utils import timezone
     now = timezone.now()
-    open_campaigns = SurveyCampaign.objects.filter(
+    open_campaigns = list(SurveyCampaign.objects.filter(
         opens_at__lte=now,
         closes_at__gte=now,
-    ).order_by('quarter')
+    ).order_by('quarter'))
+
+    # Get invitations for open campaigns (only show campaigns faculty was explicitly
+    # added to), with their responses, in one query
+    open_invitations = {
+        inv.campaign_id: inv
+        for inv in SurveyInvitation.objects.filter(
+            campaign__in=open_campaigns,
+            faculty=faculty,
+        ).select_related('response').defer('response__response_data')
+    } if open_campaigns else {}
 
-    # Get invitations for open campaigns (only show campaigns faculty was explicitly added to)
     open_surveys = []
     for campaign in open_campaigns:
-        invitation = SurveyInvitation.objects.filter(
-            campaign=campaign,
-            faculty=faculty
-        ).first()
+        invitation = open_invitations.get(campaign.pk)
 
         # Only show campaigns where faculty has an invitation
         if invitation:
-            response = SurveyResponse.objects.filter(
-                invitation=invitation
-            ).first()
             open_surveys.append({
                 'campaign': campaign,
                 'invitation': invitation,
-                'response': response,
+                'response': getattr(invitation, 'response', None),
             })
 
     # For backward compatibility, also set current_campaign to first open one
-    current_campaign = open_campaigns.first() if open_campaigns.exists() else None
+    current_campaign = open_campaigns[0] if open_campaigns else None
     current_invitation = open_surveys[0]['invitation'] if open_surveys else None
     current_response = open_surveys[0]['response'] if open_surveys else None
 
@@ -965,12 +1043,24 @@ def faculty_portal(request, token):
         faculty=faculty,
         campaign__academic_year=academic_year,
         status='submitted'
-    ).select_related('campaign').order_by('-submitted_at')
+    ).order_by('-submitted_at')
 
     # Exclude all open campaigns from past submissions
-    if open_campaigns.exists():
+    if open_campaigns:
         past_submissions = past_submissions.exclude(campaign__in=open_campaigns)
 
+    # The page only lists name, date and total, so fetch just those as dicts
+    # (total_points is None when there is no response)
+    past_submissions = past_submissions.values(
+        'submitted_at',
+        campaign_name=F('campaign__name'),
+        total_points=(
+            F('response__citizenship_points') + F('response__education_points') +
+            F('response__research_points') + F('response__leadership_points') +
+            F('response__content_expert_points')
+        ),
+    )
+
     # Get survey data for the year
     from reports_app.models import FacultySurveyData, DepartmentalData
     from reports_app.views import get_combined_activities
@@ -1065,12 +1155,79 @@ def faculty_portal(request, token):
     })
 
 
+def _get_survey_invitation(token, defer_response_data=False):
+    """
+    Fetch an invitation by token with its campaign, faculty and response in one
+    query, or raise Http404.
+
+    Pass defer_response_data=True on pages that only show per-category
+    points/completion, so the response JSON isn't read from the database.
+
+    Deliberately not cached between requests: a submit or an admin unlock must
+    be seen by the next request in every worker process.
+    """
+    queryset = SurveyInvitation.objects.select_related(
+        'campaign', 'campaign__academic_year', 'faculty', 'response'
+    )
+    if defer_response_data:
+        queryset = queryset.defer('response__response_data')
+    return get_object_or_404(queryset, token=token)
+
+
+@functools.lru_cache(maxsize=None)
+def _survey_page_version():
+    """
+    Deploy/config part of the survey page ETag, computed once per process.
+
+    Combines the app version and build hash with a digest of the point values
+    and category config this process renders with, so a deploy or point
+    change invalidates cached pages even if no response changed.
+    """
+    from reports_app.context_processors import get_app_version
+    from .survey_config import POINT_VALUES, SURVEY_CATEGORIES
+
+    config = json.dumps(
+        [POINT_VALUES, SURVEY_CATEGORIES, CATEGORY_ORDER],
+        sort_keys=True, default=str,
+    )
+    return '%s|%s' % (
+        get_app_version()['display'],
+        hashlib.blake2s(config.encode()).hexdigest(),
+    )
+
+
+def _survey_page_etag(request, token, category=None):
+    """
+    Weak ETag for survey landing/category pages.
+
+    Changes when the invitation, campaign or response is saved, the campaign
+    opens or closes, a different user views the page, or a new deploy or
+    point configuration is live. Returns None (render normally) for non-GET
+    requests, pending flash messages, or no response yet.
+    """
+    if request.method != 'GET' or len(messages.get_messages(request)):
+        return None
+
+    row = SurveyInvitation.objects.filter(token=token).values_list(
+        'status', 'updated_at', 'campaign__is_active', 'campaign__opens_at',
+        'campaign__closes_at', 'campaign__updated_at', 'response__updated_at',
+    ).first()
+    if row is None or row[-1] is None:
+        return None
+
+    status, inv_updated, is_active, opens_at, closes_at, campaign_updated, response_updated = row
+    is_open = is_active and opens_at <= timezone.now() <= closes_at
+    key = '|'.join(str(part) for part in (
+        _survey_page_version(), token, category, status, inv_updated, is_open,
+        campaign_updated, response_updated, request.user.pk,
+    ))
+    return 'W/"%s"' % hashlib.blake2s(key.encode()).hexdigest()
+
+
+@condition(etag_func=_survey_page_etag)
 def survey_landing(request, token):
     """Landing page after clicking email link."""
-    invitation = get_object_or_404(
-        SurveyInvitation.objects.select_related('campaign', 'faculty', 'campaign__academic_year'),
-        token=token
-    )
+    invitation = _get_survey_invitation(token, defer_response_data=True)
 
     # Check if campaign is open
     if not invitation.campaign.is_open:
@@ -1083,10 +1240,13 @@ def survey_landing(request, token):
     # Mark first access
     invitation.mark_accessed()
 
-    # Get or create response
-    response, created = SurveyResponse.objects.get_or_create(
-        invitation=invitation
-    )
+    # Get or create response (usually already loaded with the invitation)
+    response = getattr(invitation, 'response', None)
+    created = False
+    if response is None:
+        response, created = SurveyResponse.objects.get_or_create(
+            invitation=invitation
+        )
 
     # If new response, pre-populate with carry-forward data from previous quarters
     if created:
@@ -1100,18 +1260,7 @@ def survey_landing(request, token):
             response.save(update_fields=['response_data'])
 
     # Build category list from config (only show configured categories)
-    categories = []
-    for cat_key in CATEGORY_ORDER:
-        cat_config = get_category_config(cat_key)
-        if cat_config:
-            is_complete = getattr(response, f'{cat_key}_complete', False)
-            points = getattr(response, f'{cat_key}_points', 0)
-            categories.append({
-                'key': cat_key,
-                'name': cat_config['name'],
-                'complete': is_complete,
-                'points': points,
-            })
+    categories = response.category_summary
 
     # Find first incomplete category for "Continue" button
     first_incomplete = None
@@ -1129,12 +1278,10 @@ def survey_landing(request, token):
     return render(request, 'survey/faculty/landing.html', context)
 
 
+@condition(etag_func=_survey_page_etag)
 def survey_category(request, token, category):
     """Category form page with repeating sections - config-driven."""
-    invitation = get_object_or_404(
-        SurveyInvitation.objects.select_related('campaign', 'faculty'),
-        token=token
-    )
+    invitation = _get_survey_invitation(token)
 
     # Get category config
     category_config = get_category_config(category)
@@ -1146,8 +1293,11 @@ def survey_category(request, token, category):
         messages.error(request, 'This survey is no longer accepting submissions')
         return redirect('survey:survey_landing', token=token)
 
-    # Get or create response
-    response, created = SurveyResponse.objects.get_or_create(invitation=invitation)
+    # Get or create response (usually already loaded with the invitation)
+    response = getattr(invitation, 'response', None)
+    created = False
+    if response is None:
+        response, created = SurveyResponse.objects.get_or_create(invitation=invitation)
 
     # If new response, pre-populate with carry-forward data
     if created:
@@ -1172,16 +1322,18 @@ def survey_category(request, token, category):
         # Mark category complete
         setattr(response, f'{category}_complete', True)
 
-        response.save()
-
-        # Log the change for audit trail
+        # Save and log the change for audit trail in one commit
         from .models import SurveyResponseHistory
-        SurveyResponseHistory.log_change(
-            response=response,
-            action='update',
-            category=category,
-            request=request
-        )
+        with transaction.atomic():
+            response.save(update_fields=[
+                'response_data', f'{category}_points', f'{category}_complete', 'updated_at'
+            ])
+            SurveyResponseHistory.log_change(
+                response=response,
+                action='update',
+                category=category,
+                request=request
+            )
 
         messages.success(request, f'{category_config["name"]} saved')
 
@@ -1201,19 +1353,10 @@ def survey_category(request, token, category):
     category_data = response.get_category_data(category)
 
     # Build navigation info for tabs
-    nav_categories = []
-    for cat_key in CATEGORY_ORDER:
-        cat_config = get_category_config(cat_key)
-        if cat_config:
-            is_complete = getattr(response, f'{cat_key}_complete', False)
-            points = getattr(response, f'{cat_key}_points', 0)
-            nav_categories.append({
-                'key': cat_key,
-                'name': cat_config['name'],
-                'complete': is_complete,
-                'points': points,
-                'active': cat_key == category,
-            })
+    nav_categories = [
+        {**cat, 'active': cat['key'] == category}
+        for cat in response.category_summary
+    ]
 
     context = {
         'invitation': invitation,
@@ -1230,17 +1373,17 @@ def survey_category(request, token, category):
 
 def survey_review(request, token):
     """Review all responses before submission."""
-    invitation = get_object_or_404(
-        SurveyInvitation.objects.select_related('campaign', 'faculty'),
-        token=token
-    )
+    # The page only shows per-category points and completion
+    invitation = _get_survey_invitation(token, defer_response_data=True)
 
     # Check if campaign is open
     if not invitation.campaign.is_open:
         messages.error(request, 'This survey is no longer accepting submissions')
         return redirect('survey:survey_landing', token=token)
 
-    response = get_object_or_404(SurveyResponse, invitation=invitation)
+    response = getattr(invitation, 'response', None)
+    if response is None:
+        raise Http404("Survey response not found")
 
     context = {
         'invitation': invitation,
@@ -1259,17 +1402,16 @@ def survey_review(request, token):
 @require_POST
 def survey_submit(request, token):
     """Submit the survey and merge into FacultySurveyData."""
-    invitation = get_object_or_404(
-        SurveyInvitation.objects.select_related('campaign', 'faculty', 'campaign__academic_year'),
-        token=token
-    )
+    invitation = _get_survey_invitation(token)
 
     # Check if campaign is open
     if not invitation.campaign.is_open:
         messages.error(request, 'This survey is no longer accepting submissions')
         return redirect('survey:survey_landing', token=token)
 
-    response = get_object_or_404(SurveyResponse, invitation=invitation)
+    response = getattr(invitation, 'response', None)
+    if response is None:
+        raise Http404("Survey response not found")
     is_resubmission = invitation.status == 'submitted'
 
     with transaction.atomic():
@@ -1287,9 +1429,12 @@ def survey_submit(request, token):
             request=request
         )
 
-        # Send confirmation email only on first submission
+        # Send confirmation email only on first submission, once the submit
+        # has committed, on a background thread so the redirect doesn't wait on SMTP
         if not is_resubmission:
-            _send_confirmation_email(invitation)
+            transaction.on_commit(
+                lambda: _run_in_background(_send_confirmation_email, invitation)
+            )
 
     if is_resubmission:
         messages.success(request, 'Your changes have been saved!')
@@ -1300,12 +1445,11 @@ def survey_submit(request, token):
 
 def survey_confirmation(request, token):
     """Confirmation page after submission."""
-    invitation = get_object_or_404(
-        SurveyInvitation.objects.select_related('campaign', 'faculty'),
-        token=token
-    )
+    invitation = _get_survey_invitation(token, defer_response_data=True)
 
-    response = get_object_or_404(SurveyResponse, invitation=invitation)
+    response = getattr(invitation, 'response', None)
+    if response is None:
+        raise Http404("Survey response not found")
 
     context = {
         'invitation': invitation,
@@ -1317,32 +1461,48 @@ def survey_confirmation(request, token):
 @require_POST
 def survey_save_draft(request, token):
     """AJAX endpoint to save draft data."""
-    invitation = get_object_or_404(SurveyInvitation, token=token)
+    # The draft is written into response_data by the database, so don't load it
+    invitation = _get_survey_invitation(token, defer_response_data=True)
 
     if not invitation.campaign.is_open:
         return JsonResponse({'error': 'Survey is closed'}, status=400)
 
-    response, _ = SurveyResponse.objects.get_or_create(invitation=invitation)
+    response = getattr(invitation, 'response', None)
+    if response is None:
+        response, _ = SurveyResponse.objects.get_or_create(invitation=invitation)
 
-    # Parse JSON data from request
-    import json
+    # Parse JSON data from request: {"category": ..., "data": {form field: value}}
     try:
-        data = json.loads(request.body)
-        category = data.get('category')
-        category_data = data.get('data', {})
-
-        if category:
-            response.response_data[category] = category_data
-            points = _calculate_category_points(category_data, category)
-            setattr(response, f'{category}_points', points)
-            response.save()
-
-        return JsonResponse({
-            'success': True,
-            'points': points if category else 0,
-        })
+        payload = json.loads(request.body)
     except json.JSONDecodeError:
         return JsonResponse({'error': 'Invalid JSON'}, status=400)
+    if not isinstance(payload, dict):
+        return JsonResponse({'error': 'Invalid payload'}, status=400)
+
+    category = payload.get('category')
+    if not category:
+        return JsonResponse({'success': True, 'points': 0})
+
+    category_config = get_category_config(category) if isinstance(category, str) else None
+    if not category_config:
+        return JsonResponse({'error': 'Unknown category'}, status=400)
+
+    # Drafts carry the same field names/values as the category form POST, and
+    # are parsed the same way so only configured subsections are stored
+    form_data = payload.get('data', {})
+    if not isinstance(form_data, dict) or not all(
+        isinstance(value, str) for value in form_data.values()
+    ):
+        return JsonResponse({'error': 'Invalid draft data'}, status=400)
+
+    category_data = _process_category_form_from_config(form_data, category_config)
+    points = calculate_category_points(category, category_data)
+    response.save_category_draft(category, category_data, points)
+
+    return JsonResponse({
+        'success': True,
+        'points': points,
+    })
 
 
 # =============================================================================
@@ -1357,15 +1517,16 @@ def faculty_login(request):
         if not email:
             messages.error(request, 'Please enter your email address')
         else:
-            # Find active invitations for this faculty
-            invitations = SurveyInvitation.objects.filter(
+            # Find an active invitation for this faculty (the portal link
+            # covers all of them, so one is enough)
+            invitation = SurveyInvitation.objects.filter(
                 faculty__email__iexact=email,
                 campaign__is_active=True,
-            ).select_related('campaign')
+            ).select_related('faculty').first()
 
-            if invitations.exists():
-                # Send magic link email with all active survey links
-                _send_magic_link_email(email, invitations)
+            if invitation is not None:
+                # Send magic link email with their portal link
+                _send_magic_link_email(email, invitation.faculty)
                 messages.success(
                     request,
                     'If your email is in our system, you will receive a link shortly.'
@@ -1395,15 +1556,13 @@ def survey_demo_landing(request):
     """Demo landing page showing all survey categories (read-only preview)."""
     # Build category list from config
     categories = []
-    for cat_key in CATEGORY_ORDER:
-        cat_config = get_category_config(cat_key)
-        if cat_config:
-            categories.append({
-                'key': cat_key,
-                'name': cat_config['name'],
-                'complete': False,
-                'points': 0,
-            })
+    for cat in CATEGORY_TABLE:
+        categories.append({
+            'key': cat.key,
+            'name': cat.name,
+            'complete': False,
+            'points': 0,
+        })
 
     context = {
         'demo_mode': True,
@@ -1422,15 +1581,13 @@ def survey_demo_category(request, category):
 
     # Build nav categories
     nav_categories = []
-    for cat_key in CATEGORY_ORDER:
-        cat_config = get_category_config(cat_key)
-        if cat_config:
-            nav_categories.append({
-                'key': cat_key,
-                'name': cat_config['name'],
-                'active': cat_key == category,
-                'complete': False,
-            })
+    for cat in CATEGORY_TABLE:
+        nav_categories.append({
+            'key': cat.key,
+            'name': cat.name,
+            'active': cat.key == category,
+            'complete': False,
+        })
 
     context = {
         'demo_mode': True,
@@ -1447,19 +1604,239 @@ def survey_demo_category(request, category):
 # HELPER FUNCTIONS
 # =============================================================================
 
-def _send_invitation_email(invitation):
-    """Send invitation email to faculty. Returns True on success."""
+def _open_mail_connection():
+    """
+    Open one mail connection to share across a batch of sends.
+
+    If the server can't be reached, each send retries on its own and logs its
+    own failure. Close it with _close_mail_connection() when done.
+    """
+    from django.core.mail import get_connection
+
+    connection = get_connection()
+    try:
+        connection.open()
+    except Exception:
+        pass
+    return connection
+
+
+def _close_mail_connection(connection):
+    """Close a shared mail connection, ignoring errors from a dead server."""
+    try:
+        connection.close()
+    except Exception:
+        pass
+
+
+def _reopen_mail_connection(connection):
+    """
+    Replace a shared mail connection's (possibly broken) session with a fresh
+    one, so the rest of the batch keeps reusing a single connection.
+    """
+    _close_mail_connection(connection)
+    try:
+        connection.open()
+    except Exception:
+        pass
+
+
+def _send_bulk_emails(invitations, send_email):
+    """
+    Send one email per invitation with send_email (e.g. _send_invitation_email).
+
+    SMTP is I/O-bound, so the invitations are split across up to
+    SURVEY_EMAIL_WORKERS threads, each reusing its own mail connection.
+    If SURVEY_EMAIL_RATE_LIMIT is set, sends are spaced out so the threads
+    together stay under that many messages per second.
+    EmailLog rows are collected and saved together once sending is done.
+    Returns (list of invitations sent successfully, failed_count).
+    """
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+    from django.conf import settings
+    from django.db import connection as db_connection
+
+    invitations = list(invitations)
+    if not invitations:
+        return [], 0
+
+    workers = max(1, min(getattr(settings, 'SURVEY_EMAIL_WORKERS', 4), len(invitations)))
+    batches = [invitations[i::workers] for i in range(workers)]
+
+    rate_limit = getattr(settings, 'SURVEY_EMAIL_RATE_LIMIT', 0)
+    min_interval = 1 / rate_limit if rate_limit > 0 else 0
+    slot_lock = threading.Lock()
+    next_slot = [time.monotonic()]
+
+    def wait_for_slot():
+        # Hand out evenly spaced send times shared by all worker threads
+        with slot_lock:
+            now = time.monotonic()
+            slot = max(now, next_slot[0])
+            next_slot[0] = slot + min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    def send_batch(batch):
+        sent = []
+        logs = []
+        mail_connection = _open_mail_connection()
+        try:
+            for invitation in batch:
+                if min_interval:
+                    wait_for_slot()
+                if send_email(invitation, connection=mail_connection, logs=logs):
+                    sent.append(invitation)
+        finally:
+            _close_mail_connection(mail_connection)
+            # Each worker thread has its own DB connection; don't leak it
+            db_connection.close()
+        return sent, logs
+
+    sent = []
+    logs = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for batch_sent, batch_logs in executor.map(send_batch, batches):
+            sent.extend(batch_sent)
+            logs.extend(batch_logs)
+
+    # One INSERT per 500 log rows instead of one per email
+    EmailLog.objects.bulk_create(logs, batch_size=500)
+    return sent, len(invitations) - len(sent)
+
+
+def _send_bulk_invitations(invitations):
+    """
+    Bulk-send invitation emails, then stamp email_sent_at on the successful
+    ones with a single UPDATE. Returns (sent_count, failed_count).
+    """
+    from functools import partial
+
+    sent, failed_count = _send_bulk_emails(
+        invitations, partial(_send_invitation_email, mark_sent=False)
+    )
+    if sent:
+        SurveyInvitation.objects.filter(
+            pk__in=[inv.pk for inv in sent]
+        ).update(email_sent_at=timezone.now())
+    return len(sent), failed_count
+
+
+def _claim_pending_invitations(campaign):
+    """
+    Claim the campaign's not-yet-emailed invitations by stamping email_sent_at
+    before sending, so concurrent "send to all pending" requests never email
+    the same faculty twice. Rows locked by another sender are skipped.
+    Returns the claimed invitations.
+    """
+    claimed_at = timezone.now()
+    with transaction.atomic():
+        pks = list(
+            campaign.invitations.filter(email_sent_at__isnull=True)
+            .select_for_update(skip_locked=True)
+            .values_list('pk', flat=True)
+        )
+        if not pks:
+            return []
+        # Conditional UPDATE, so a row stamped since the SELECT isn't re-claimed
+        # on backends without row locks (SQLite)
+        SurveyInvitation.objects.filter(
+            pk__in=pks, email_sent_at__isnull=True
+        ).update(email_sent_at=claimed_at)
+
+    return list(
+        SurveyInvitation.objects.filter(pk__in=pks, email_sent_at=claimed_at)
+        .select_related('faculty', 'campaign')
+    )
+
+
+def _send_claimed_invitations(invitations):
+    """
+    Send invitations claimed by _claim_pending_invitations, releasing the
+    claim on the ones that failed so they can be retried.
+    Returns (sent_count, failed_count).
+    """
+    from functools import partial
+
+    sent, failed_count = _send_bulk_emails(
+        invitations, partial(_send_invitation_email, mark_sent=False)
+    )
+    if failed_count:
+        sent_pks = {inv.pk for inv in sent}
+        SurveyInvitation.objects.filter(
+            pk__in=[inv.pk for inv in invitations if inv.pk not in sent_pks]
+        ).update(email_sent_at=None)
+    return len(sent), failed_count
+
+
+def _is_transient_mail_error(exc):
+    """True for SMTP failures worth retrying: dropped connections, timeouts, 4xx replies."""
+    import smtplib
+
+    if isinstance(exc, smtplib.SMTPResponseException):
+        return 400 <= exc.smtp_code < 500
+    return isinstance(exc, (smtplib.SMTPServerDisconnected, TimeoutError, ConnectionError))
+
+
+def _send_mail_with_retry(connection=None, **kwargs):
+    """
+    send_mail() that retries transient failures up to SURVEY_EMAIL_RETRIES
+    times, with exponential backoff and jitter. Permanent failures (e.g.
+    refused recipients) are raised straight away.
+    """
+    import random
+    import time
     from django.core.mail import send_mail
     from django.conf import settings
-    from django.urls import reverse
+
+    retries = getattr(settings, 'SURVEY_EMAIL_RETRIES', 2)
+    for attempt in range(retries + 1):
+        try:
+            return send_mail(connection=connection, **kwargs)
+        except Exception as e:
+            if attempt == retries or not _is_transient_mail_error(e):
+                raise
+            time.sleep(min(0.5 * 2 ** attempt, 5) + random.uniform(0, 0.5))
+            if connection is not None:
+                # Replace the broken session; later sends keep reusing it
+                _reopen_mail_connection(connection)
+
+
+def _faculty_portal_url(faculty):
+    """Absolute URL of a faculty member's portal, for use in emails."""
+    from django.conf import settings
+
+    base_url = getattr(settings, 'SITE_URL', 'http://localhost:8000')
+    return f"{base_url}/my/{faculty.access_token}/"
+
+
+def _log_email(logs, **fields):
+    """Save an EmailLog row, or queue it on logs for the caller to bulk_create."""
+    if logs is None:
+        EmailLog.objects.create(**fields)
+    else:
+        logs.append(EmailLog(**fields))
+
+
+def _send_invitation_email(invitation, connection=None, mark_sent=True, logs=None):
+    """
+    Send invitation email to faculty. Returns True on success.
+
+    Pass a shared mail connection (see _open_mail_connection) when sending
+    in bulk so each message doesn't reconnect to the SMTP server. Bulk
+    senders pass mark_sent=False and record email_sent_at themselves, and
+    pass a logs list to collect the EmailLog rows instead of saving each.
+    """
+    from django.conf import settings
 
     try:
         campaign = invitation.campaign
         faculty = invitation.faculty
 
-        # Build portal URL (faculty portal is the stable entry point)
-        base_url = settings.SITE_URL if hasattr(settings, 'SITE_URL') else 'http://localhost:8000'
-        survey_url = f"{base_url}/my/{faculty.access_token}/"
+        # Faculty portal is the stable entry point
+        survey_url = _faculty_portal_url(faculty)
 
         # Format deadline
         deadline = campaign.closes_at.strftime('%B %d, %Y at %I:%M %p')
@@ -1500,20 +1877,23 @@ This link is unique to you. Please do not share it.
 Thank you,
 UNMC Department of Anesthesiology"""
 
-        send_mail(
+        _send_mail_with_retry(
             subject=subject,
             message=message,
             from_email=from_email,
             recipient_list=[faculty.email],
             fail_silently=False,
+            connection=connection,
         )
 
         # Update invitation
-        invitation.email_sent_at = timezone.now()
-        invitation.save(update_fields=['email_sent_at'])
+        if mark_sent:
+            invitation.email_sent_at = timezone.now()
+            invitation.save(update_fields=['email_sent_at'])
 
         # Log email
-        EmailLog.objects.create(
+        _log_email(
+            logs,
             invitation=invitation,
             email_type='invitation',
             recipient=faculty.email,
@@ -1524,8 +1904,12 @@ UNMC Department of Anesthesiology"""
         return True
 
     except Exception as e:
+        if connection is not None:
+            # The shared connection may be dead; reconnect once for later sends
+            _reopen_mail_connection(connection)
         # Log failure
-        EmailLog.objects.create(
+        _log_email(
+            logs,
             invitation=invitation,
             email_type='invitation',
             recipient=invitation.faculty.email,
@@ -1536,20 +1920,20 @@ UNMC Department of Anesthesiology"""
         return False
 
 
-def _send_reminder_email(invitation):
-    """Send reminder email. Returns True on success."""
-    from django.core.mail import send_mail
+def _send_reminder_email(invitation, connection=None, logs=None):
+    """
+    Send reminder email. Returns True on success. Accepts a shared connection
+    and a logs list, as _send_invitation_email does.
+    """
     from django.conf import settings
-    from django.urls import reverse
     from django.utils.timezone import localtime
 
     try:
         campaign = invitation.campaign
         faculty = invitation.faculty
 
-        # Build portal URL (faculty portal is the stable entry point)
-        base_url = settings.SITE_URL if hasattr(settings, 'SITE_URL') else 'http://localhost:8000'
-        survey_url = f"{base_url}/my/{faculty.access_token}/"
+        # Faculty portal is the stable entry point
+        survey_url = _faculty_portal_url(faculty)
 
         # Use campaign-specific from address or default
         if campaign.email_from_name and campaign.email_from_address:
@@ -1594,16 +1978,18 @@ Deadline: {deadline}
 Thank you,
 UNMC Department of Anesthesiology"""
 
-        send_mail(
+        _send_mail_with_retry(
             subject=subject,
             message=message,
             from_email=from_email,
             recipient_list=[faculty.email],
             fail_silently=False,
+            connection=connection,
         )
 
         # Log email
-        EmailLog.objects.create(
+        _log_email(
+            logs,
             invitation=invitation,
             email_type='reminder',
             recipient=faculty.email,
@@ -1614,7 +2000,11 @@ UNMC Department of Anesthesiology"""
         return True
 
     except Exception as e:
-        EmailLog.objects.create(
+        if connection is not None:
+            # The shared connection may be dead; reconnect once for later sends
+            _reopen_mail_connection(connection)
+        _log_email(
+            logs,
             invitation=invitation,
             email_type='reminder',
             recipient=invitation.faculty.email,
@@ -1625,6 +2015,24 @@ UNMC Department of Anesthesiology"""
         return False
 
 
+def _run_in_background(func, *args):
+    """
+    Call func(*args) on a separate thread, for email sends that the request
+    shouldn't wait on. The thread is non-daemon so a worker shutting down
+    finishes the send, and it closes its own DB connection when done.
+    """
+    import threading
+    from django.db import connection as db_connection
+
+    def run():
+        try:
+            func(*args)
+        finally:
+            db_connection.close()
+
+    threading.Thread(target=run).start()
+
+
 def _send_confirmation_email(invitation):
     """Send submission confirmation email."""
     from django.core.mail import send_mail
@@ -1684,17 +2092,13 @@ UNMC Department of Anesthesiology"""
         )
 
 
-def _send_magic_link_email(email, invitations):
+def _send_magic_link_email(email, faculty):
     """Send email with portal link."""
     from django.core.mail import send_mail
     from django.conf import settings
 
     try:
-        base_url = settings.SITE_URL if hasattr(settings, 'SITE_URL') else 'http://localhost:8000'
-
-        # Get faculty from first invitation to get portal token
-        faculty = invitations[0].faculty
-        portal_url = f"{base_url}/my/{faculty.access_token}/"
+        portal_url = _faculty_portal_url(faculty)
 
         subject = f"{settings.SURVEY_EMAIL_SUBJECT_PREFIX}Your Survey Portal Link"
 
@@ -1746,6 +2150,21 @@ def _process_category_form_from_config(post_data, category_config):
     """
     result = {}
 
+    # Find the entry indices of every repeating subsection in one pass over
+    # the POST keys, which look like subsection_key_{index}_{field_name}
+    repeating_keys = [
+        sub['key'] for sub in category_config['subsections'] if sub['type'] == 'repeating'
+    ]
+    entry_indices_by_key = {key: set() for key in repeating_keys}
+    if repeating_keys:
+        entry_key_re = re.compile(
+            r'(%s)_(\d+)(?:_|$)' % '|'.join(map(re.escape, repeating_keys))
+        )
+        for key in post_data.keys():
+            match = entry_key_re.match(key)
+            if match:
+                entry_indices_by_key[match.group(1)].add(int(match.group(2)))
+
     for subsection in category_config['subsections']:
         subsection_key = subsection['key']
         sub_data = {}
@@ -1759,19 +2178,8 @@ def _process_category_form_from_config(post_data, category_config):
         if subsection['type'] == 'repeating':
             entries = []
 
-            # Dynamically find all entry indices from POST data
-            # Look for pattern: subsection_key_{index}_{field_name}
-            entry_indices = set()
-            prefix = f"{subsection_key}_"
-            for key in post_data.keys():
-                if key.startswith(prefix) and key != f"{subsection_key}_trigger":
-                    # Extract index from key like "committees_3_type"
-                    parts = key[len(prefix):].split('_', 1)
-                    if len(parts) >= 1 and parts[0].isdigit():
-                        entry_indices.add(int(parts[0]))
-
             # Process each found entry
-            for i in sorted(entry_indices):
+            for i in sorted(entry_indices_by_key[subsection_key]):
                 entry = {}
                 has_data = False
 
@@ -1779,6 +2187,11 @@ def _process_category_form_from_config(post_data, category_config):
                     field_name = f"{subsection_key}_{i}_{field['name']}"
                     value = post_data.get(field_name, '').strip()
                     if value:
+                        # Store number fields as JSON numbers so scoring doesn't re-parse them
+                        if field['type'] == 'number':
+                            number = parse_number(value)
+                            if number is not None:
+                                value = number
                         entry[field['name']] = value
                         has_data = True
 
@@ -1809,8 +2222,9 @@ def _merge_response_to_faculty_data(response):
     academic_year = invitation.campaign.academic_year
     quarter = invitation.campaign.quarter
 
-    # Get or create FacultySurveyData
-    faculty_data, created = FacultySurveyData.objects.get_or_create(
+    # Get or create FacultySurveyData, locking the row until the submit commits
+    # so concurrent submissions (other quarters) can't overwrite each other's merge
+    faculty_data, created = FacultySurveyData.objects.select_for_update().get_or_create(
         faculty=faculty,
         academic_year=academic_year,
     )
@@ -1857,12 +2271,20 @@ def _merge_response_to_faculty_data(response):
         faculty_data.content_expert_points
     )
 
-    # Update quarters reported
-    quarters = set(faculty_data.quarters_reported or [])
-    quarters.add(quarter)
-    faculty_data.quarters_reported = list(quarters)
+    # Only rewrite the survey-derived columns (imported data is left alone)
+    update_fields = [
+        'activities_json', 'citizenship_points', 'education_points',
+        'research_points', 'leadership_points', 'content_expert_points',
+        'survey_total_points', 'updated_at',
+    ]
+
+    # Update quarters reported (kept sorted; untouched on resubmission)
+    quarters = faculty_data.quarters_reported or []
+    if quarter not in quarters:
+        faculty_data.quarters_reported = sorted([*quarters, quarter])
+        update_fields.append('quarters_reported')
 
-    faculty_data.save()
+    faculty_data.save(update_fields=update_fields)
 
 
 # =============================================================================
@@ -262,6 +262,15 @@ SURVEY_EMAIL_SUBJECT_PREFIX = os.environ.get(
     '[UNMC Anesthesiology] '
 )
 
+# Parallel SMTP connections used for bulk invitation/reminder sends
+SURVEY_EMAIL_WORKERS = int(os.environ.get('SURVEY_EMAIL_WORKERS', '4'))
+
+# Max messages per second for a bulk send, across all its connections (0 = no limit)
+SURVEY_EMAIL_RATE_LIMIT = float(os.environ.get('SURVEY_EMAIL_RATE_LIMIT', '0'))
+
+# Retries (with exponential backoff) for transient SMTP failures per email
+SURVEY_EMAIL_RETRIES = int(os.environ.get('SURVEY_EMAIL_RETRIES', '2'))
+
 # Site URL for email links (defaults to localhost for development)
 SITE_URL = os.environ.get('SITE_URL', 'http://localhost:8001')
 